@@ -11,34 +11,164 @@ Modules:
 - blog_generator.utils: Contains the `create_ui` function that builds the Gradio interface.
 """
 
-from dotenv import load_dotenv
+import atexit
+import io
+import importlib
 import logging
-from blog_generator.utils import create_ui
-
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("blog_generator.log"),
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger("BlogPostGenerator")
+import logging.handlers
+import os
+import queue
+import signal
+import sys
+import threading
+
+def _rotate_if_large(path, max_bytes=5 * 1024 * 1024, backups=3):
+    """
+    Roll the log file over once at startup if it has grown past `max_bytes`.
+
+    `RotatingFileHandler` checks the file size on every emit, which roughly
+    doubles the cost of each record. Checking once per run keeps the file
+    bounded across runs; growth within a single (short-lived) session is
+    tolerated.
+    """
+    try:
+        if os.stat(path).st_size < max_bytes:
+            return
+    except FileNotFoundError:
+        return
+
+    oldest = f"{path}.{backups}"
+    if os.path.exists(oldest):
+        os.remove(oldest)
+    for i in range(backups - 1, 0, -1):
+        src = f"{path}.{i}"
+        if os.path.exists(src):
+            os.replace(src, f"{path}.{i + 1}")
+    os.replace(path, f"{path}.1")
+
+
+def _configure_logging():
+    """
+    Set up logging for the application.
+
+    Records are pushed onto a queue by the calling thread and written to the
+    console (and optionally a file) by a background listener, so log calls
+    never block on I/O.
+
+    The file sink is only enabled when `BLOG_LOG_FILE` is set; in production
+    the console output is typically collected by systemd/docker already. File
+    writes are batched in memory and flushed in bulk (or immediately on
+    ERROR), using a compact format without timestamps since formatting
+    `%(asctime)s` dominates per-record cost.
+
+    If `BLOG_LOG_FILE` ends in `.bin`, records are written in the compact
+    binary format from `blog_generator.binlog` instead (decode with
+    `tools/decode_log.py`).
+
+    Does nothing if the root logger already has handlers (e.g. on reload),
+    which would otherwise duplicate every record.
 
-# Load environment variables
-load_dotenv()
+    Returns:
+        tuple: The running `QueueListener` and the buffered file handler
+        (or None when file logging is disabled or already configured).
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return None, None
+    # Don't wrap every handler call in error reporting
+    logging.raiseExceptions = False
+
+    # Line-buffered stderr: one write per record without an explicit flush
+    try:
+        stream = open(sys.stderr.fileno(), mode='w', buffering=1, closefd=False,
+                      encoding=sys.stderr.encoding, errors='backslashreplace')
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        # No stderr (pythonw) or one without a real file descriptor
+        stream_handler = logging.StreamHandler()
+    else:
+        stream_handler = logging.StreamHandler(stream)
+    stream_handler.setFormatter(
+        logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    )
+    handlers = [stream_handler]
+
+    buffered_handler = None
+    log_file = os.getenv("BLOG_LOG_FILE")
+    if log_file and log_file.endswith(".bin"):
+        # Binary frames; the handler buffers and batches writes itself
+        from blog_generator.binlog import BinaryLogHandler
+        _rotate_if_large(log_file)
+        buffered_handler = BinaryLogHandler(log_file)
+        handlers.append(buffered_handler)
+    elif log_file:
+        _rotate_if_large(log_file)
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(logging.Formatter('%(levelname)s %(name)s %(message)s'))
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=512, flushLevel=logging.ERROR, target=file_handler, flushOnClose=True
+        )
+        handlers.append(buffered_handler)
+
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    return listener, buffered_handler
+
+
+logger = logging.getLogger("BlogPostGenerator")
 
 
 def main():
     """
     Main function to run the blog post generator UI.
 
-    - Initializes and launches the Gradio web interface.
+    - Loads environment variables from the `.env` file.
+    - Configures logging (console, plus `BLOG_LOG_FILE` when set).
+    - Initializes and launches the Gradio web interface, then waits for
+      SIGINT/SIGTERM and flushes pending log records before exiting.
     - UI is created via the `create_ui` function from `blog_generator.utils`.
+
+    Heavy imports (Gradio, CrewAI) are deferred to this function so that
+    importing `app` stays cheap and free of side effects.
     """
+    # Warm up the (slow) Gradio import while the environment and logging
+    # are set up; the import lock makes the later import in utils safe.
+    preload = threading.Thread(target=importlib.import_module, args=("gradio",), daemon=True)
+    preload.start()
+
+    from blog_generator.env import load_env_once
+    load_env_once()
+    listener, buffered_handler = _configure_logging()
+
+    preload.join()
+    from blog_generator.utils import create_ui
     demo = create_ui()
-    demo.launch()
+    shutdown = threading.Event()
+
+    def _graceful(signum, frame):
+        logger.info("Received signal %s, shutting down", signum)
+        shutdown.set()
+
+    try:
+        demo.launch(prevent_thread_lock=True)
+        signal.signal(signal.SIGTERM, _graceful)
+        signal.signal(signal.SIGINT, _graceful)
+        # Poll rather than block so the main thread stays responsive to
+        # signals on every platform
+        while not shutdown.wait(0.5):
+            pass
+        demo.close()
+    finally:
+        # Drain queued records, then push buffered ones to disk
+        if listener is not None:
+            atexit.unregister(listener.stop)
+            listener.stop()
+        if buffered_handler is not None:
+            buffered_handler.flush()
 
 
 if __name__ == "__main__":
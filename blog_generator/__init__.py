@@ -0,0 +1,28 @@
+"""
+AI Blog Post Generator package.
+
+Public names are resolved lazily (PEP 562) so that `import blog_generator`
+does not pull in Gradio, CrewAI or NLTK until the attribute is first used.
+"""
+
+import importlib
+
+_LAZY = {
+    "BlogPostGenerator": "blog_generator.agents",
+    "create_ui": "blog_generator.utils",
+    "load_env_once": "blog_generator.env",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -7,11 +7,9 @@ Classes:
 BlogPostGenerator: Main class that orchestrates the content generation pipeline
 Dependencies:
 - crewai: Framework for multi-agent AI systems
-- langchain_google_genai: Google Gemini AI integration
-- requests: HTTP requests for API calls
+- httpx: Pooled HTTP client for API calls
 - nltk: Natural language processing for sentiment analysis
 - markdown: Markdown to HTML conversion
-- gradio: Web interface for user interaction
 Environment Variables Required:
 - GOOGLE_API_KEY: Google Gemini API key
 - SERPER_API_KEY: Serper web search API key (optional)
@@ -34,42 +32,34 @@ Example Usage:
 
 import os
 import json
-import requests
+import asyncio
+import aiofiles
+import atexit
+import httpx
+import orjson
+from diskcache import Cache
 from datetime import datetime, timedelta
-from dotenv import load_dotenv
-import markdown
 from crewai import Agent, Task, Crew, Process
 from crewai.tools import tool
-from functools import lru_cache
-from langchain_google_genai import ChatGoogleGenerativeAI
-from typing import Optional, Dict, Any
+from functools import cache, lru_cache, wraps
+from typing import Optional, Dict, Any, Callable, NamedTuple
 import logging
-from tqdm import tqdm
-import nltk
-from nltk.sentiment import SentimentIntensityAnalyzer
 import re
 import random
 from crewai import LLM
 import time
 import hashlib
-import gradio as gr
-from gradio.components import Markdown, HTML
-import webbrowser
+import html
+import tempfile
+import threading
 from pathlib import Path
+from blog_generator.env import load_env_once
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("blog_generator.log"),
-        logging.StreamHandler()
-    ]
-)
+# Logging is configured by the application entry point (app.py)
 logger = logging.getLogger("BlogPostGenerator")
 
 # Load environment variables
-load_dotenv()
+load_env_once()
 
 # Initialize Gemini with proper error handling
 try:
@@ -83,22 +73,272 @@ try:
     logger.info("*****************************************")
     logger.info("Successfully initialized Gemini model")
 except Exception as e:
-    logger.error(f"Failed to initialize Gemini: {str(e)}")
+    logger.error("Failed to initialize Gemini: %s", e)
     raise
 
+# How long Serper/Unsplash responses are cached, in seconds
+API_CACHE_TTL = 3600
+
+# Gemini Batch API polling
+BATCH_POLL_INTERVAL = 30
+BATCH_DONE_STATES = {'JOB_STATE_SUCCEEDED', 'JOB_STATE_FAILED', 'JOB_STATE_CANCELLED', 'JOB_STATE_EXPIRED'}
+
+# Precompiled patterns for markdown post-processing
+_RE_BACKTICKS_ALONE = re.compile(r'^```\s*$', re.MULTILINE)
+_RE_CODEFENCE_LANG = re.compile(r'```[a-zA-Z]+\n')
+_RE_CITATION = re.compile(r'\[\d+\]|\[\w+\d*\]|Source:')
+_RE_HEADINGS = re.compile(r'^(#{2,4})\s+(.+)$', re.MULTILINE)
+_RE_H2 = re.compile(r'^#{2}\s+.+$', re.MULTILINE)
+_RE_H1 = re.compile(r'^#\s+.+$', re.MULTILINE)
+_SLUG_STRIP = re.compile(r'[^\w\s-]')
+_SLUG_DASH = re.compile(r'[-\s]+')
+
+
+class PostPaths(NamedTuple):
+    """Files belonging to one generated post"""
+    md: Path
+    html: Path
+    name: str
+
+
+@lru_cache(maxsize=256)
+def _post_paths(md_path: str) -> PostPaths:
+    """Derive a post's markdown and HTML paths from its markdown file path"""
+    path = Path(md_path)
+    return PostPaths(md=path, html=path.with_suffix('.html'), name=path.name)
+
+
+def _slugify(text: str) -> str:
+    """Turn a title into a lowercase, dash-separated slug"""
+    return _SLUG_DASH.sub('-', _SLUG_STRIP.sub('', text).strip().lower())
+
+
+# HTML page template for rendered posts (literal CSS braces are doubled)
+_HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.7.0/styles/github.min.css">
+    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.7.0/highlight.min.js"></script>
+    <script>hljs.highlightAll();</script>
+    <style>
+        body {{
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            line-height: 1.8;
+            color: #333;
+            max-width: 900px;
+            margin: 0 auto;
+            padding: 20px;
+            background-color: #f9f9f9;
+        }}
+        h1, h2, h3, h4 {{
+            color: #2c3e50;
+            margin-top: 1.5em;
+            margin-bottom: 0.5em;
+        }}
+        h1 {{
+            border-bottom: 2px solid #eee;
+            padding-bottom: 10px;
+        }}
+        img {{
+            max-width: 100%;
+            height: auto;
+            border-radius: 8px;
+            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+            margin: 20px 0;
+        }}
+        code {{
+            font-family: 'SFMono-Regular', Consolas, 'Liberation Mono', Menlo, monospace;
+            background-color: #f5f5f5;
+            padding: 2px 6px;
+            border-radius: 4px;
+            font-size: 0.9em;
+        }}
+        pre {{
+            background-color: #f5f5f5;
+            padding: 16px;
+            border-radius: 8px;
+            overflow-x: auto;
+            margin: 20px 0;
+            border-left: 4px solid #3498db;
+        }}
+        blockquote {{
+            border-left: 4px solid #3498db;
+            padding-left: 16px;
+            margin-left: 0;
+            color: #555;
+            font-style: italic;
+        }}
+        a {{
+            color: #3498db;
+            text-decoration: none;
+        }}
+        a:hover {{
+            text-decoration: underline;
+        }}
+        .toc {{
+            background-color: #f0f7ff;
+            padding: 15px;
+            border-radius: 8px;
+            margin-bottom: 20px;
+        }}
+        .toc ul {{
+            padding-left: 20px;
+        }}
+        .toc li {{
+            margin-bottom: 8px;
+        }}
+        .meta {{
+            color: #7f8c8d;
+            font-size: 0.9em;
+            margin-bottom: 20px;
+        }}
+        table {{
+            border-collapse: collapse;
+            width: 100%;
+            margin: 20px 0;
+        }}
+        th, td {{
+            border: 1px solid #ddd;
+            padding: 8px;
+            text-align: left;
+        }}
+        th {{
+            background-color: #f2f2f2;
+        }}
+    </style>
+</head>
+<body>
+    {body}
+</body>
+</html>"""
+
+# Stands in for the featured image URL until the image lookup completes
+_IMAGE_PLACEHOLDER = "featured-image-placeholder"
+
+# 'toc' gives headings the ids the generated table of contents links to
+# (see _toc_entries)
+_MD_EXTENSIONS = ('extra', 'toc', 'fenced_code', 'tables')
+
+
+# A single Markdown instance is reused (via reset()) across renders, so the
+# extensions are only set up once; the lock serializes concurrent renders
+_md = None
+_md_lock = threading.Lock()
+
+
+def _markdown():
+    """Return the shared Markdown instance, creating it on first use; hold _md_lock"""
+    global _md
+    if _md is None:
+        import markdown
+        _md = markdown.Markdown(extensions=list(_MD_EXTENSIONS), output_format='html5')
+    return _md
+
+
+@lru_cache(maxsize=128)
+def _render_md(content: str) -> str:
+    """Convert markdown to HTML, reusing the result for recently rendered content"""
+    with _md_lock:
+        return _markdown().reset().convert(content)
+
+
+def _toc_entries(content: str) -> list:
+    """
+    List the headings of content as (level, id, name), in document order.
+    
+    The ids and names come from the 'toc' extension, so they are exactly what
+    the rendered HTML uses.
+    """
+    with _md_lock:
+        md = _markdown().reset()
+        md.convert(content)
+        tokens = md.toc_tokens
+    
+    entries = []
+    stack = list(reversed(tokens))
+    while stack:
+        token = stack.pop()
+        entries.append((token['level'], token['id'], token['name']))
+        stack.extend(reversed(token['children']))
+    return entries
+
+
+# Sidecar file next to each post holding the SHA-256 of the markdown its
+# HTML was last rendered from, so unchanged saves can skip re-rendering
+DIGEST_SUFFIX = '.sha256'
+
+
+def _content_digest(content: str) -> str:
+    """Return the hex SHA-256 digest of markdown content"""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def _read_digest(path: str) -> Optional[str]:
+    """Read a digest sidecar file, returning None if it doesn't exist"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=64)
+def _read_post(path: str, mtime_ns: int) -> str:
+    """Read a post's markdown; keyed on mtime so rewritten files are re-read"""
+    return Path(path).read_text(encoding='utf-8')
+
+
+@cache
+def _sia():
+    """
+    Load NLTK's VADER analyzer once per process, on first use.
+    
+    Returns None (and doesn't retry) if NLTK or its lexicon is unavailable.
+    """
+    try:
+        import nltk
+        from nltk.sentiment import SentimentIntensityAnalyzer
+        nltk.download('vader_lexicon', quiet=True)
+        analyzer = SentimentIntensityAnalyzer()
+        logger.info("Successfully initialized sentiment analyzer")
+        return analyzer
+    except Exception as e:
+        logger.warning("Failed to initialize NLTK components: %s", e)
+        return None
+
+
+async def _write_text(path: str, text: str):
+    """Write a text file without blocking the event loop"""
+    async with aiofiles.open(path, 'w', encoding='utf-8') as f:
+        await f.write(text)
+
+
+# Tool descriptions are kept as constants rather than read from docstrings,
+# so the tools still work when docstrings are stripped (python -OO)
+SEARCH_WEB_DESCRIPTION = "Search the web for current information on topics."
+FIND_IMAGE_DESCRIPTION = "Find appropriate images for blog posts based on a query."
+
+
+def _make_tool(name: str, func, description: str):
+    """Wrap a callable as a CrewAI tool with an explicit description"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+    wrapper.__doc__ = description
+    return tool(name)(wrapper)
+
+
 class BlogPostGenerator:
     def __init__(self):
         self.output_folder = "generated_posts"
         os.makedirs(self.output_folder, exist_ok=True)
         
-        # Initialize NLTK components
-        try:
-            nltk.download('vader_lexicon', quiet=True)
-            self.sentiment_analyzer = SentimentIntensityAnalyzer()
-            logger.info("Successfully initialized sentiment analyzer")
-        except Exception as e:
-            logger.warning(f"Failed to initialize NLTK components: {str(e)}")
-            self.sentiment_analyzer = None
+        # Cached post listing, keyed on the output folder's mtime
+        self._posts_mtime_ns = -1
+        self._posts_listing = []
         
         # API keys validation
         self.serper_api_key = os.getenv('SERPER_API_KEY')
@@ -110,8 +350,23 @@ class BlogPostGenerator:
         if not self.unsplash_api_key:
             logger.warning("UNSPLASH_ACCESS_KEY not found in environment variables")
         
+        # Shared HTTP client so Serper/Unsplash calls reuse pooled connections
+        self._http = httpx.Client(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+        )
+        atexit.register(self._http.close)
+        
+        # Persistent LRU cache for Serper/Unsplash responses
+        self._cache = Cache(
+            ".api_cache",
+            size_limit=64 * 1024 * 1024,
+            eviction_policy="least-recently-used"
+        )
+        
         # Default tech-related images
-        self.default_images = [
+        self.default_images = (
             "https://images.unsplash.com/photo-1620712943543-bcc4688e7485",
             "https://images.unsplash.com/photo-1550751827-4bd374c3f58b",
             "https://images.unsplash.com/photo-1526374965328-7f61d4dc18c5",
@@ -122,7 +377,7 @@ class BlogPostGenerator:
             "https://images.unsplash.com/photo-1531297484001-80022131f5a1",
             "https://images.unsplash.com/photo-1555949963-ff9fe0c870eb",
             "https://images.unsplash.com/photo-1581472723648-909f4851d4ae"
-        ]
+        )
         
         # Initialize agents
         self.initialize_agents()
@@ -130,8 +385,8 @@ class BlogPostGenerator:
     def initialize_agents(self):
         """Initialize all agents with their roles and tools"""
         # Create the search_web and find_image tools bound to this instance
-        search_web_tool = tool("WebSearch")(self.search_web)
-        find_image_tool = tool("ImageFinder")(self.find_image)
+        search_web_tool = _make_tool("WebSearch", self.search_web, SEARCH_WEB_DESCRIPTION)
+        find_image_tool = _make_tool("ImageFinder", self.find_image, FIND_IMAGE_DESCRIPTION)
         
         # Researcher agent
         self.researcher = Agent(
@@ -203,8 +458,18 @@ class BlogPostGenerator:
     
     def _generate_cache_key(self, func_name: str, args: tuple, kwargs: Dict[str, Any]) -> str:
         """Generate a unique cache key based on function name and arguments"""
-        args_str = str(args) + str(sorted(kwargs.items()))
-        return hashlib.md5(f"{func_name}:{args_str}".encode()).hexdigest()
+        h = hashlib.blake2b(digest_size=16)
+        h.update(func_name.encode())
+        h.update(b'\x00')
+        for arg in args:
+            h.update(repr(arg).encode())
+            h.update(b'\x00')
+        for key, value in sorted(kwargs.items()):
+            h.update(key.encode())
+            h.update(b'=')
+            h.update(repr(value).encode())
+            h.update(b'\x00')
+        return h.hexdigest()
     
     def search_web(self, query: str, date_range: Optional[str] = None) -> str:
         """Search the web for current information on topics."""
@@ -221,6 +486,11 @@ Snippet: Mock data showing how search results would appear with proper API confi
 URL: https://example.com
 """
         
+        cache_key = self._generate_cache_key('search_web', (query,), {'date_range': date_range})
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         params = {
             'q': query,
             'gl': 'us',
@@ -242,20 +512,16 @@ URL: https://example.com
                 end_date = datetime.now().strftime('%Y-%m-%d')
                 params['timePeriod'] = f'custom:{start_date}:{end_date}'
 
-        headers = {
-            'X-API-KEY': self.serper_api_key,
-            'Content-Type': 'application/json'
-        }
+        headers = {'X-API-KEY': self.serper_api_key}
         
         try:
-            response = requests.post(
+            response = self._http.post(
                 'https://google.serper.dev/search',
                 headers=headers,
-                data=json.dumps(params),
-                timeout=10
+                json=params
             )
             response.raise_for_status()
-            results = response.json()
+            results = orjson.loads(response.content)
             
             formatted_results = []
             
@@ -267,45 +533,57 @@ URL: https://example.com
                     formatted_results.append(formatted_result)
             
             if not formatted_results:
-                return f"No relevant search results were found for '{query}'."
+                search_result = f"No relevant search results were found for '{query}'."
+            else:
+                search_result = "\n".join(formatted_results)
             
-            return "\n".join(formatted_results)
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Search API request failed: {str(e)}")
+            self._cache.set(cache_key, search_result, expire=API_CACHE_TTL)
+            return search_result
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+            logger.error("Search API request failed: %s", e)
             return f"The search for '{query}' failed due to a network or API error."
     
     def find_image(self, query: str) -> str:
         """Find appropriate images for blog posts based on a query."""
         if self.unsplash_api_key:
+            cache_key = self._generate_cache_key('find_image', (query,), {})
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+            
             try:
                 url = f"https://api.unsplash.com/search/photos"
                 headers = {"Authorization": f"Client-ID {self.unsplash_api_key}"}
                 params = {"query": query, "per_page": 1}
                 
-                response = requests.get(url, headers=headers, params=params, timeout=10)
+                response = self._http.get(url, headers=headers, params=params)
                 response.raise_for_status()
-                data = response.json()
+                data = orjson.loads(response.content)
                 
                 if data["results"]:
                     image_url = data["results"][0]["urls"]["regular"]
-                    logger.info(f"Found image from Unsplash for query: {query}")
+                    logger.info("Found image from Unsplash for query: %s", query)
+                    self._cache.set(cache_key, image_url, expire=API_CACHE_TTL)
                     return image_url
             except Exception as e:
-                logger.warning(f"Unsplash API request failed: {str(e)}")
+                logger.warning("Unsplash API request failed: %s", e)
         
-        logger.info(f"Using default image for query: {query}")
-        return random.choice(self.default_images)
+        logger.info("Using default image for query: %s", query)
+        # Seed with the query so the same topic always gets the same fallback
+        rng = random.Random(query)
+        return self.default_images[rng.randrange(len(self.default_images))]
     
     def _analyze_sentiment(self, text: str) -> Optional[dict]:
         """Analyze the sentiment of text to ensure positive/neutral tone"""
-        if not self.sentiment_analyzer:
+        analyzer = _sia()
+        if analyzer is None:
             return None
         
         try:
-            sentiment = self.sentiment_analyzer.polarity_scores(text)
+            sentiment = analyzer.polarity_scores(text)
             return sentiment
         except Exception as e:
-            logger.warning(f"Sentiment analysis failed: {str(e)}")
+            logger.warning("Sentiment analysis failed: %s", e)
             return None
     
     def _clean_markdown(self, content: str) -> str:
@@ -314,10 +592,10 @@ URL: https://example.com
         content = content.replace("```markdown", "").replace("```", "")
         
         # Remove any remaining triple backticks that might be alone
-        content = re.sub(r'^```\s*$', '', content, flags=re.MULTILINE)
+        content = _RE_BACKTICKS_ALONE.sub('', content)
         
         # Remove any language specifiers from code blocks
-        content = re.sub(r'```[a-zA-Z]+\n', '```\n', content)
+        content = _RE_CODEFENCE_LANG.sub('```\n', content)
         
         return content.strip()
     
@@ -338,7 +616,7 @@ URL: https://example.com
             if "```" not in content:
                 issues.append("Technical topic with no code examples")
         
-        if not re.search(r'\[\d+\]|\[\w+\d*\]|Source:', content):
+        if not _RE_CITATION.search(content):
             issues.append("No citations or references found")
         
         return issues
@@ -379,263 +657,464 @@ URL: https://example.com
             context=[research_task]
         )
         
+        # Fact checking and illustration only depend on the draft, so they
+        # run concurrently (async_execution) and the editor waits for both
+        
         # Fact checking task
         fact_check_task = Task(
             description=f"""Review the blog post about '{topic}' and verify all technical claims.""",
             expected_output="A detailed fact-checking report with specific corrections",
             agent=self.fact_checker,
-            context=[write_task]
+            context=[write_task],
+            async_execution=True
+        )
+        
+        # Illustration task
+        illustrate_task = Task(
+            description=f"""Find appropriate visual elements for the blog post about '{topic}'.
+            Include featured image and supporting images at key points.""",
+            expected_output="Markdown formatted image references positioned in the post",
+            agent=self.illustrator,
+            context=[write_task],
+            async_execution=True
         )
         
         # Editing task
         edit_task = Task(
             description=f"""Review and edit the blog post about '{topic}'.
             Ensure technical accuracy, clear writing style, and proper structure.
+            Apply the fact checker's corrections and place the suggested images at the indicated points.
             Remove any unnecessary markdown code block markers.""",
             expected_output="A polished, publication-ready blog post in markdown format",
             agent=self.editor,
-            context=[write_task, fact_check_task]
+            context=[write_task, fact_check_task, illustrate_task]
         )
         
-        # Illustration task
-        illustrate_task = Task(
-            description=f"""Find appropriate visual elements for the blog post about '{topic}'.
-            Include featured image and supporting images at key points.""",
-            expected_output="Markdown formatted image references positioned in the post",
-            agent=self.illustrator,
-            context=[edit_task]
+        return [research_task, write_task, fact_check_task, illustrate_task, edit_task]
+    
+    def _build_crew(self, topic: str, focus: str, tone: str, length: str) -> Crew:
+        """Create the crew of agents and tasks for a single post"""
+        tasks = self._create_tasks(topic, focus, tone, length)
+        return Crew(
+            agents=[self.researcher, self.writer, self.fact_checker, self.illustrator, self.editor],
+            tasks=tasks,
+            verbose=True,
+            process=Process.sequential
         )
+    
+    async def _finalize_post(self, topic: str, focus: str, add_toc: bool, result,
+                             analyze_sentiment: bool = False) -> dict:
+        """Post-process the crew output and write the markdown and HTML files"""
+        # Extract the actual content string from CrewOutput object
+        if hasattr(result, 'raw_output'):
+            content = result.raw_output
+        elif hasattr(result, 'result'):
+            content = result.result
+        elif hasattr(result, 'output'):
+            content = result.output
+        else:
+            content = str(result)
+        
+        # Clean the markdown content
+        content = self._clean_markdown(content)
+        
+        validation_issues = self._validate_content(content)
+        if validation_issues:
+            logger.warning("Content validation issues: %s", validation_issues)
+        
+        filename = f"{_slugify(topic)}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+        filepath = os.path.join(self.output_folder, filename)
         
-        return [research_task, write_task, fact_check_task, edit_task, illustrate_task]
+        # Assemble the post from pieces and join once at the end
+        header = ""
+        if "![Featured Image]" not in content:
+            header = f"# {topic}\n\n"
+            reading_time = max(5, len(content) // 1000)
+            header += f"> **Reading time:** {reading_time} min | **Difficulty:** Intermediate | **Published:** {datetime.now().strftime('%B %d, %Y')}\n\n"
+            header += f"![Featured Image]({_IMAGE_PLACEHOLDER})\n\n"
+        pieces = [header, content]
+        
+        # Add table of contents if requested
+        if add_toc and "## Table of Contents" not in content:
+            headings = _RE_HEADINGS.findall(content)
+            if headings:
+                # Insert the TOC heading after the first H2, falling back to the first H1
+                toc_heading = "## Table of Contents\n\n"
+                toc_index = None
+                intro_end = _RE_H2.search(content)
+                if intro_end:
+                    pos = intro_end.end()
+                    pieces = [header, content[:pos], "\n\n", toc_heading, content[pos:]]
+                    toc_index = 3
+                elif header:
+                    # The header starts with the post title
+                    pos = header.index("\n")
+                    pieces = [header[:pos], "\n\n", toc_heading, header[pos:], content]
+                    toc_index = 2
+                else:
+                    first_heading = _RE_H1.search(content)
+                    if first_heading:
+                        pos = first_heading.end()
+                        pieces = [content[:pos], "\n\n", toc_heading, content[pos:]]
+                        toc_index = 2
+                
+                if toc_index is not None:
+                    # List the headings with the ids the 'toc' extension assigns
+                    # when rendering, so the links always match
+                    toc = [toc_heading]
+                    for level, anchor, name in _toc_entries("".join(pieces)):
+                        if 2 <= level <= 4 and not (level == 2 and name == "Table of Contents"):
+                            title = html.unescape(name).replace('[', '\\[').replace(']', '\\]')
+                            toc.append(f"{'  ' * (level - 2)}- [{title}](#{anchor})\n")
+                    toc.append("\n")
+                    pieces[toc_index] = "".join(toc)
+        final_content = "".join(pieces)
+        
+        # Look up the image, score sentiment and render the HTML concurrently;
+        # the featured image URL is substituted once the lookup finishes
+        image_url, sentiment, html_content = await asyncio.gather(
+            asyncio.to_thread(self.find_image, topic),
+            (asyncio.to_thread(self._analyze_sentiment, content[:1000])
+             if analyze_sentiment and content else asyncio.sleep(0)),
+            asyncio.to_thread(_render_md, final_content)
+        )
+        final_content = final_content.replace(_IMAGE_PLACEHOLDER, image_url)
+        html_content = html_content.replace(_IMAGE_PLACEHOLDER, html.escape(image_url))
+        html_path = str(_post_paths(filepath).html)
+        
+        # Enhanced HTML template with better styling
+        html_template = _HTML_TEMPLATE.format(title=topic, body=html_content)
+        
+        # Write the markdown and HTML files (plus the digest of the markdown
+        # the HTML was rendered from) concurrently
+        await asyncio.gather(
+            _write_text(filepath, final_content),
+            _write_text(html_path, html_template),
+            _write_text(filepath + DIGEST_SUFFIX, _content_digest(final_content))
+        )
+        
+        logger.info("Successfully generated blog post: %s", filepath)
+        
+        return {
+            'topic': topic,
+            'focus': focus,
+            'content': final_content,
+            'html_content': html_template,
+            'image_url': image_url,
+            'filepath': filepath,
+            'html_path': html_path,
+            'validation_issues': validation_issues,
+            'sentiment': sentiment
+        }
+    
+    def _error_result(self, topic: str, error: Exception) -> dict:
+        """Build the result dict returned when generating a post fails"""
+        logger.error("Error generating post for '%s': %s", topic, error)
+        return {
+            'error': str(error),
+            'topic': topic,
+            'content': f"Error generating content: {str(error)}"
+        }
     
     def generate_blog_post(self, topic: str, focus: str, date_range: str, 
                          add_toc: bool, seo_optimized: bool, tone: str, 
-                         length: str, temperature: float) -> dict:
-        """Generate a single blog post with given parameters"""
-        logger.info(f"Generating post for topic: {topic}")
+                         length: str, temperature: float,
+                         analyze_sentiment: bool = False,
+                         task_callback: Optional[Callable] = None) -> dict:
+        """
+        Generate a single blog post with given parameters.
         
-        # Update LLM temperature
-        llm.temperature = temperature
+        Blocking wrapper around the async pipeline; use `generate_blog_posts`
+        from code that already runs an event loop. Sentiment scoring is only
+        run when `analyze_sentiment` is set. `task_callback` is called with each
+        task's output as soon as that task finishes, possibly from another thread.
+        """
+        return asyncio.run(self._generate_blog_post_async(
+            topic=topic,
+            focus=focus,
+            date_range=date_range,
+            add_toc=add_toc,
+            seo_optimized=seo_optimized,
+            tone=tone,
+            length=length,
+            temperature=temperature,
+            analyze_sentiment=analyze_sentiment,
+            task_callback=task_callback
+        ))
+    
+    async def _kickoff_async(self, crew: Crew, temperature: float,
+                             task_callback: Optional[Callable] = None):
+        """Run a copy of the crew with the given temperature without blocking the event loop"""
+        # Work on a copy of the crew so concurrent posts don't share agent
+        # state, and set the temperature on the copied LLMs only
+        crew = crew.copy()
+        for agent in crew.agents:
+            agent.llm.temperature = temperature
+        if task_callback is not None:
+            crew.task_callback = task_callback
+        return await crew.kickoff_async()
+    
+    async def _generate_blog_post_async(self, topic: str, focus: str, date_range: str,
+                                        add_toc: bool, seo_optimized: bool, tone: str,
+                                        length: str, temperature: float,
+                                        analyze_sentiment: bool = False,
+                                        task_callback: Optional[Callable] = None) -> dict:
+        """Generate a single blog post without blocking the event loop"""
+        logger.info("Generating post for topic: %s", topic)
         
-        # Create tasks for the crew
-        tasks = self._create_tasks(topic, focus, tone, length)
+        try:
+            result = await self._kickoff_async(self._build_crew(topic, focus, tone, length),
+                                               temperature, task_callback)
+            return await self._finalize_post(topic, focus, add_toc, result, analyze_sentiment)
+        except Exception as e:
+            return self._error_result(topic, e)
+    
+    async def generate_blog_posts(self, topics: list, concurrency: int = 4,
+                                  batch_mode: bool = False) -> list:
+        """
+        Generate several blog posts concurrently.
         
-        # Create crew and execute tasks
-        crew = Crew(
-            agents=[self.researcher, self.writer, self.fact_checker, self.editor, self.illustrator],
-            tasks=tasks,
-            verbose=True,
-            process=Process.sequential
-        )
+        Args:
+            topics: List of dicts with the keyword arguments of `generate_blog_post`
+            concurrency: Maximum number of posts generated at the same time
+            batch_mode: Send the research and fact-checking prompts of all posts
+                through the Gemini Batch API (cheaper, but slower per post)
+        
+        Returns:
+            list: One result dict (or exception) per topic, in input order
+        """
+        if batch_mode:
+            return await self._generate_blog_posts_batched(topics, concurrency)
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _one(params):
+            async with semaphore:
+                return await self._generate_blog_post_async(**params)
+        
+        return await asyncio.gather(*[_one(params) for params in topics], return_exceptions=True)
+    
+    async def _generate_blog_posts_batched(self, topics: list, concurrency: int) -> list:
+        """
+        Generate several blog posts, batching the research and fact-checking phases.
+        
+        The research and fact-checking prompts of all posts are each submitted as
+        a single Gemini batch job. Writing, illustration and editing stay on the
+        interactive API since they are on each post's critical path.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        post_tasks = [self._create_tasks(p['topic'], p['focus'], p['tone'], p['length']) for p in topics]
+        temperatures = [p['temperature'] for p in topics]
+        
+        async def _limited(func, *args):
+            async with semaphore:
+                return await func(*args)
         
+        # Research: fetch search results up front, since batch requests can't call tools
         try:
-            result = crew.kickoff()
-            
-            # Extract the actual content string from CrewOutput object
-            if hasattr(result, 'raw_output'):
-                content = result.raw_output
-            elif hasattr(result, 'result'):
-                content = result.result
-            elif hasattr(result, 'output'):
-                content = result.output
-            else:
-                content = str(result)
-            
-            # Clean the markdown content
-            content = self._clean_markdown(content)
-            
-            validation_issues = self._validate_content(content)
-            if validation_issues:
-                logger.warning(f"Content validation issues: {validation_issues}")
-            
-            image_url = self.find_image(topic)
-            sentiment = self._analyze_sentiment(content[:1000]) if len(content) > 0 else None
-            
-            clean_topic = re.sub(r'[^\w\s-]', '', topic).strip().lower()
-            clean_topic = re.sub(r'[-\s]+', '-', clean_topic)
-            filename = f"{clean_topic}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
-            filepath = os.path.join(self.output_folder, filename)
-            
-            final_content = content
-            if "![Featured Image]" not in final_content:
-                header = f"# {topic}\n\n"
-                reading_time = max(5, len(final_content) // 1000)
-                header += f"> **Reading time:** {reading_time} min | **Difficulty:** Intermediate | **Published:** {datetime.now().strftime('%B %d, %Y')}\n\n"
-                header += f"![Featured Image]({image_url})\n\n"
-                final_content = header + final_content
-            
-            # Add table of contents if requested
-            if add_toc and "## Table of Contents" not in final_content:
-                headings = re.findall(r'^(#{2,4})\s+(.+)$', final_content, re.MULTILINE)
-                if headings:
-                    toc = "## Table of Contents\n\n"
-                    for level, title in headings:
-                        indent = "  " * (len(level) - 2)
-                        slug = re.sub(r'[^\w\s-]', '', title).strip().lower()
-                        slug = re.sub(r'[-\s]+', '-', slug)
-                        toc += f"{indent}- [{title}](#{slug})\n"
-                    toc += "\n"
-                    
-                    intro_end = re.search(r'^#{2}\s+.+$', final_content, re.MULTILINE)
-                    if intro_end:
-                        pos = intro_end.end()
-                        final_content = final_content[:pos] + "\n\n" + toc + final_content[pos:]
-                    else:
-                        first_heading = re.search(r'^#\s+.+$', final_content, re.MULTILINE)
-                        if first_heading:
-                            pos = first_heading.end()
-                            final_content = final_content[:pos] + "\n\n" + toc + final_content[pos:]
-            
-            # Write the markdown file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(final_content)
-            
-            # Generate HTML preview with better styling
-            html_content = markdown.markdown(final_content, extensions=['extra', 'codehilite', 'tables'])
-            html_path = filepath.replace('.md', '.html')
-            
-            # Enhanced HTML template with better styling
-            html_template = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{topic}</title>
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.7.0/styles/github.min.css">
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.7.0/highlight.min.js"></script>
-    <script>hljs.highlightAll();</script>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            line-height: 1.8;
-            color: #333;
-            max-width: 900px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f9f9f9;
-        }}
-        h1, h2, h3, h4 {{
-            color: #2c3e50;
-            margin-top: 1.5em;
-            margin-bottom: 0.5em;
-        }}
-        h1 {{
-            border-bottom: 2px solid #eee;
-            padding-bottom: 10px;
-        }}
-        img {{
-            max-width: 100%;
-            height: auto;
-            border-radius: 8px;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-            margin: 20px 0;
-        }}
-        code {{
-            font-family: 'SFMono-Regular', Consolas, 'Liberation Mono', Menlo, monospace;
-            background-color: #f5f5f5;
-            padding: 2px 6px;
-            border-radius: 4px;
-            font-size: 0.9em;
-        }}
-        pre {{
-            background-color: #f5f5f5;
-            padding: 16px;
-            border-radius: 8px;
-            overflow-x: auto;
-            margin: 20px 0;
-            border-left: 4px solid #3498db;
-        }}
-        blockquote {{
-            border-left: 4px solid #3498db;
-            padding-left: 16px;
-            margin-left: 0;
-            color: #555;
-            font-style: italic;
-        }}
-        a {{
-            color: #3498db;
-            text-decoration: none;
-        }}
-        a:hover {{
-            text-decoration: underline;
-        }}
-        .toc {{
-            background-color: #f0f7ff;
-            padding: 15px;
-            border-radius: 8px;
-            margin-bottom: 20px;
-        }}
-        .toc ul {{
-            padding-left: 20px;
-        }}
-        .toc li {{
-            margin-bottom: 8px;
-        }}
-        .meta {{
-            color: #7f8c8d;
-            font-size: 0.9em;
-            margin-bottom: 20px;
-        }}
-        table {{
-            border-collapse: collapse;
-            width: 100%;
-            margin: 20px 0;
-        }}
-        th, td {{
-            border: 1px solid #ddd;
-            padding: 8px;
-            text-align: left;
-        }}
-        th {{
-            background-color: #f2f2f2;
-        }}
-    </style>
-</head>
-<body>
-    {html_content}
-</body>
-</html>"""
-            
-            with open(html_path, 'w', encoding='utf-8') as f:
-                f.write(html_template)
-            
-            logger.info(f"Successfully generated blog post: {filepath}")
-            
-            return {
-                'topic': topic,
-                'focus': focus,
-                'content': final_content,
-                'html_content': html_template,
-                'image_url': image_url,
-                'filepath': filepath,
-                'html_path': html_path,
-                'validation_issues': validation_issues,
-                'sentiment': sentiment
-            }
-            
+            searches = await asyncio.gather(*[
+                asyncio.to_thread(self.search_web, f"{p['topic']} {p['focus']}", p.get('date_range'))
+                for p in topics
+            ])
+            reports = await asyncio.to_thread(
+                self._run_gemini_batch,
+                [self._task_prompt(tasks[0], search) for tasks, search in zip(post_tasks, searches)],
+                temperatures
+            )
         except Exception as e:
-            logger.error(f"Error generating post for '{topic}': {str(e)}")
-            return {
-                'error': str(e),
-                'topic': topic,
-                'content': f"Error generating content: {str(e)}"
-            }
+            # Without research there is nothing to write from
+            return [self._error_result(p['topic'], e) for p in topics]
+        
+        # Writing
+        async def _write(i):
+            if isinstance(reports[i], BaseException):
+                raise reports[i]
+            write_task = self._with_context(post_tasks[i][1], reports[i])
+            crew = Crew(agents=[self.writer], tasks=[write_task], verbose=True, process=Process.sequential)
+            return str(await self._kickoff_async(crew, temperatures[i]))
+        
+        drafts = await asyncio.gather(*[_limited(_write, i) for i in range(len(topics))],
+                                      return_exceptions=True)
+        
+        # Fact checking of all successful drafts
+        written = [i for i, draft in enumerate(drafts) if not isinstance(draft, BaseException)]
+        fact_reports = {}
+        if written:
+            try:
+                fact_reports = dict(zip(written, await asyncio.to_thread(
+                    self._run_gemini_batch,
+                    [self._task_prompt(post_tasks[i][2], drafts[i]) for i in written],
+                    [temperatures[i] for i in written]
+                )))
+            except Exception as e:
+                fact_reports = {i: e for i in written}
+        
+        # Illustration and editing
+        async def _finish(i):
+            params = topics[i]
+            if isinstance(drafts[i], BaseException):
+                return self._error_result(params['topic'], drafts[i])
+            if isinstance(fact_reports[i], BaseException):
+                return self._error_result(params['topic'], fact_reports[i])
+            try:
+                illustrate_task = self._with_context(post_tasks[i][3], drafts[i], async_execution=True)
+                edit_task = self._with_context(
+                    post_tasks[i][4],
+                    f"Draft:\n{drafts[i]}\n\nFact-checking report:\n{fact_reports[i]}",
+                    context=[illustrate_task]
+                )
+                crew = Crew(
+                    agents=[self.illustrator, self.editor],
+                    tasks=[illustrate_task, edit_task],
+                    verbose=True,
+                    process=Process.sequential
+                )
+                result = await self._kickoff_async(crew, temperatures[i])
+                return await self._finalize_post(params['topic'], params['focus'], params['add_toc'], result,
+                                                 params.get('analyze_sentiment', False))
+            except Exception as e:
+                return self._error_result(params['topic'], e)
+        
+        return await asyncio.gather(*[_limited(_finish, i) for i in range(len(topics))],
+                                    return_exceptions=True)
+    
+    @staticmethod
+    def _with_context(task: Task, context: str, **kwargs) -> Task:
+        """Copy a task, passing the upstream output as text instead of task context"""
+        return Task(
+            description=f"{task.description}\n\nContext:\n{context}",
+            expected_output=task.expected_output,
+            agent=task.agent,
+            **kwargs
+        )
+    
+    @staticmethod
+    def _task_prompt(task: Task, context: str) -> str:
+        """Render a task as a standalone prompt for the Gemini Batch API"""
+        agent = task.agent
+        return (
+            f"You are a {agent.role}. {agent.backstory}\n"
+            f"Your goal: {agent.goal}\n\n"
+            f"Task: {task.description}\n\n"
+            f"Expected output: {task.expected_output}\n\n"
+            f"Context:\n{context}"
+        )
+    
+    def _run_gemini_batch(self, prompts: list, temperatures: list) -> list:
+        """
+        Run prompts through the Gemini Batch API and wait for the results.
+        
+        Args:
+            prompts: Prompt texts, one per request
+            temperatures: Sampling temperature for each prompt
+        
+        Returns:
+            list: Response text for each prompt, in input order; a failed request
+            (including one with no candidates, e.g. blocked by safety filters)
+            is returned as a RuntimeError instead of its text
+        
+        Raises:
+            RuntimeError: If the batch job itself doesn't succeed
+        """
+        from google import genai
+        from google.genai import types
+        
+        client = genai.Client(api_key=os.getenv('GOOGLE_API_KEY'))
+        # GOOGLE_MODEL_NAME uses the LiteLLM "provider/model" form
+        model = os.getenv('GOOGLE_MODEL_NAME', '').split('/', 1)[-1]
+        
+        with tempfile.NamedTemporaryFile('w', suffix='.jsonl', encoding='utf-8', delete=False) as f:
+            for i, (prompt, temperature) in enumerate(zip(prompts, temperatures)):
+                request = {
+                    'contents': [{'role': 'user', 'parts': [{'text': prompt}]}],
+                    'generation_config': {'temperature': temperature}
+                }
+                f.write(json.dumps({'key': str(i), 'request': request}) + "\n")
+            requests_path = f.name
+        
+        try:
+            uploaded = client.files.upload(
+                file=requests_path,
+                config=types.UploadFileConfig(display_name='blog-generator-batch', mime_type='jsonl')
+            )
+        finally:
+            os.remove(requests_path)
+        
+        job = client.batches.create(model=model, src=uploaded.name,
+                                    config={'display_name': 'blog-generator-batch'})
+        logger.info("Submitted Gemini batch job %s with %s requests", job.name, len(prompts))
+        
+        while job.state.name not in BATCH_DONE_STATES:
+            time.sleep(BATCH_POLL_INTERVAL)
+            job = client.batches.get(name=job.name)
+        
+        if job.state.name != 'JOB_STATE_SUCCEEDED':
+            raise RuntimeError(f"Gemini batch job {job.name} finished with state {job.state.name}")
+        
+        responses = {}
+        for line in client.files.download(file=job.dest.file_name).decode('utf-8').splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            if 'response' not in item:
+                logger.warning("Gemini batch request %s failed: %s", item.get('key'), item.get('error'))
+                responses[item.get('key')] = RuntimeError(f"Gemini batch request failed: {item.get('error')}")
+                continue
+            try:
+                parts = item['response']['candidates'][0]['content']['parts']
+            except (KeyError, IndexError, TypeError):
+                feedback = item['response'].get('promptFeedback')
+                logger.warning("Gemini batch request %s returned no content: %s", item.get('key'), feedback)
+                responses[item['key']] = RuntimeError(f"Gemini batch request returned no content: {feedback}")
+                continue
+            responses[item['key']] = "".join(part.get('text', '') for part in parts)
+        
+        return [
+            responses.get(str(i), RuntimeError(f"No response for Gemini batch request {i}"))
+            for i in range(len(prompts))
+        ]
     
     def list_generated_posts(self) -> list:
-        """List all generated blog posts"""
-        files = []
-        for file in os.listdir(self.output_folder):
-            if file.endswith('.md'):
-                files.append(os.path.join(self.output_folder, file))
-        return sorted(files, key=os.path.getmtime, reverse=True)
+        """List all generated blog posts, newest first"""
+        mtime_ns = os.stat(self.output_folder).st_mtime_ns
+        if mtime_ns != self._posts_mtime_ns:
+            with os.scandir(self.output_folder) as it:
+                entries = [entry for entry in it if entry.name.endswith('.md') and entry.is_file()]
+            entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+            self._posts_listing = [os.path.join(self.output_folder, entry.name) for entry in entries]
+            self._posts_mtime_ns = mtime_ns
+        return list(self._posts_listing)
     
     def load_post_for_editing(self, filepath: str) -> str:
         """Load a post for editing"""
+        try:
+            return _read_post(filepath, os.stat(filepath).st_mtime_ns)
+        except Exception as e:
+            logger.error("Error loading post %s: %s", filepath, e)
+            return f"Error loading post: {str(e)}"
+    
+    def load_post_html(self, filepath: str) -> str:
+        """Load a post's HTML, rendering and saving it once if it was never written"""
+        html_path = _post_paths(filepath).html
+        try:
+            return html_path.read_text(encoding='utf-8')
+        except FileNotFoundError:
+            pass
+        
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
-                return f.read()
+                content = f.read()
+            heading = _RE_H1.search(content)
+            title = heading.group().lstrip('#').strip() if heading else _post_paths(filepath).md.stem
+            html_template = _HTML_TEMPLATE.format(title=title, body=_render_md(content))
+            
+            html_path.write_text(html_template, encoding='utf-8')
+            with open(filepath + DIGEST_SUFFIX, 'w', encoding='utf-8') as f:
+                f.write(_content_digest(content))
+            logger.info("Rendered missing HTML for %s", filepath)
+            return html_template
         except Exception as e:
-            logger.error(f"Error loading post {filepath}: {str(e)}")
+            logger.error("Error loading HTML for %s: %s", filepath, e)
             return f"Error loading post: {str(e)}"
     
     def save_edited_post(self, filepath: str, content: str) -> dict:
@@ -644,115 +1123,28 @@ URL: https://example.com
             # Save the markdown file
             with open(filepath, 'w', encoding='utf-8') as f:
                 f.write(content)
+            # Rewriting a post changes the listing order but not the folder mtime
+            self._posts_mtime_ns = -1
             
-            # Regenerate HTML
-            html_path = filepath.replace('.md', '.html')
-            html_content = markdown.markdown(content, extensions=['extra', 'codehilite', 'tables'])
+            html_path = str(_post_paths(filepath).html)
+            digest_path = filepath + DIGEST_SUFFIX
+            digest = _content_digest(content)
             
-            # Use the same enhanced HTML template
-            html_template = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Edited Post</title>
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.7.0/styles/github.min.css">
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.7.0/highlight.min.js"></script>
-    <script>hljs.highlightAll();</script>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            line-height: 1.8;
-            color: #333;
-            max-width: 900px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f9f9f9;
-        }}
-        h1, h2, h3, h4 {{
-            color: #2c3e50;
-            margin-top: 1.5em;
-            margin-bottom: 0.5em;
-        }}
-        h1 {{
-            border-bottom: 2px solid #eee;
-            padding-bottom: 10px;
-        }}
-        img {{
-            max-width: 100%;
-            height: auto;
-            border-radius: 8px;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-            margin: 20px 0;
-        }}
-        code {{
-            font-family: 'SFMono-Regular', Consolas, 'Liberation Mono', Menlo, monospace;
-            background-color: #f5f5f5;
-            padding: 2px 6px;
-            border-radius: 4px;
-            font-size: 0.9em;
-        }}
-        pre {{
-            background-color: #f5f5f5;
-            padding: 16px;
-            border-radius: 8px;
-            overflow-x: auto;
-            margin: 20px 0;
-            border-left: 4px solid #3498db;
-        }}
-        blockquote {{
-            border-left: 4px solid #3498db;
-            padding-left: 16px;
-            margin-left: 0;
-            color: #555;
-            font-style: italic;
-        }}
-        a {{
-            color: #3498db;
-            text-decoration: none;
-        }}
-        a:hover {{
-            text-decoration: underline;
-        }}
-        .toc {{
-            background-color: #f0f7ff;
-            padding: 15px;
-            border-radius: 8px;
-            margin-bottom: 20px;
-        }}
-        .toc ul {{
-            padding-left: 20px;
-        }}
-        .toc li {{
-            margin-bottom: 8px;
-        }}
-        .meta {{
-            color: #7f8c8d;
-            font-size: 0.9em;
-            margin-bottom: 20px;
-        }}
-        table {{
-            border-collapse: collapse;
-            width: 100%;
-            margin: 20px 0;
-        }}
-        th, td {{
-            border: 1px solid #ddd;
-            padding: 8px;
-            text-align: left;
-        }}
-        th {{
-            background-color: #f2f2f2;
-        }}
-    </style>
-</head>
-<body>
-    {html_content}
-</body>
-</html>"""
-            
-            with open(html_path, 'w', encoding='utf-8') as f:
-                f.write(html_template)
+            if os.path.exists(html_path) and _read_digest(digest_path) == digest:
+                # The HTML on disk was rendered from this exact content
+                with open(html_path, 'r', encoding='utf-8') as f:
+                    html_template = f.read()
+            else:
+                # Regenerate HTML
+                html_content = _render_md(content)
+                
+                # Use the same enhanced HTML template
+                html_template = _HTML_TEMPLATE.format(title="Edited Post", body=html_content)
+                
+                with open(html_path, 'w', encoding='utf-8') as f:
+                    f.write(html_template)
+                with open(digest_path, 'w', encoding='utf-8') as f:
+                    f.write(digest)
             
             return {
                 'status': 'success',
@@ -761,23 +1153,29 @@ URL: https://example.com
                 'html_content': html_template
             }
         except Exception as e:
-            logger.error(f"Error saving edited post {filepath}: {str(e)}")
+            logger.error("Error saving edited post %s: %s", filepath, e)
             return {
                 'status': 'error',
                 'error': str(e)
             }
     
     def delete_post(self, filepath: str) -> dict:
-        """Delete a generated post and its HTML version"""
+        """Delete a generated post, its HTML version and digest sidecar"""
         try:
             if os.path.exists(filepath):
                 os.remove(filepath)
             
-            html_path = filepath.replace('.md', '.html')
+            html_path = str(_post_paths(filepath).html)
             if os.path.exists(html_path):
                 os.remove(html_path)
             
+            digest_path = filepath + DIGEST_SUFFIX
+            if os.path.exists(digest_path):
+                os.remove(digest_path)
+            
+            self._posts_mtime_ns = -1
+            
             return {'status': 'success'}
         except Exception as e:
-            logger.error(f"Error deleting post {filepath}: {str(e)}")
+            logger.error("Error deleting post %s: %s", filepath, e)
             return {'status': 'error', 'error': str(e)}
@@ -0,0 +1,93 @@
+"""
+Binary framed log format.
+
+Each record is written as a fixed-width header followed by the UTF-8
+message bytes:
+
+    created_ns: uint64 | levelno: uint8 | msg_len: uint16 | msg: bytes
+
+This skips text formatting (timestamps in particular) on the hot path.
+Frames are accumulated in memory and written with a single `os.write` per
+flush. Use `tools/decode_log.py` to render a binary log back to text.
+"""
+
+import logging
+import os
+import struct
+
+FRAME_HEADER = struct.Struct("<QBH")
+MAX_MESSAGE_BYTES = 0xFFFF
+
+
+class BinaryLogHandler(logging.Handler):
+    """
+    Logging handler that appends binary frames to a file.
+
+    Frames are buffered and flushed once `capacity` records have
+    accumulated, when a record at or above `flush_level` arrives, and on
+    close.
+    """
+
+    def __init__(self, filename: str, capacity: int = 512, flush_level: int = logging.ERROR):
+        super().__init__()
+        self.filename = os.path.abspath(filename)
+        self.capacity = capacity
+        self.flush_level = flush_level
+        self.fd = os.open(
+            self.filename,
+            os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0),
+            0o644
+        )
+        self.buffer = bytearray()
+        self.pending = 0
+
+    def emit(self, record):
+        try:
+            message = record.getMessage()
+            if record.exc_info:
+                message = f"{message}\n{logging.Formatter().formatException(record.exc_info)}"
+            data = message.encode("utf-8", "backslashreplace")[:MAX_MESSAGE_BYTES]
+            self.buffer += FRAME_HEADER.pack(int(record.created * 1e9), record.levelno, len(data))
+            self.buffer += data
+            self.pending += 1
+            if self.pending >= self.capacity or record.levelno >= self.flush_level:
+                self._write_buffer()
+        except Exception:
+            self.handleError(record)
+
+    def _write_buffer(self):
+        view = memoryview(self.buffer)
+        while view:
+            written = os.write(self.fd, view)
+            view = view[written:]
+        view.release()
+        self.buffer.clear()
+        self.pending = 0
+
+    def flush(self):
+        with self.lock:
+            if self.buffer and self.fd is not None:
+                self._write_buffer()
+
+    def close(self):
+        with self.lock:
+            try:
+                if self.fd is not None:
+                    if self.buffer:
+                        self._write_buffer()
+                    os.close(self.fd)
+                    self.fd = None
+            finally:
+                super().close()
+
+
+def decode_frames(data: bytes):
+    """Yield `(created, levelno, message)` tuples from binary log data"""
+    offset = 0
+    size = len(data)
+    while offset + FRAME_HEADER.size <= size:
+        created_ns, levelno, length = FRAME_HEADER.unpack_from(data, offset)
+        offset += FRAME_HEADER.size
+        message = data[offset:offset + length].decode("utf-8", "replace")
+        offset += length
+        yield created_ns / 1e9, levelno, message
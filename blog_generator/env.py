@@ -0,0 +1,41 @@
+"""
+Environment loading helpers.
+
+The `.env` file is parsed at most once per process. When every variable the
+app reads is already present (e.g. injected by a container runtime), or a
+parent process has already loaded them, parsing is skipped entirely.
+Otherwise `.env` only fills in the variables that are missing; values
+already in the environment are never overridden.
+
+If `tools/compile_env.py` has been run, the precompiled
+`blog_generator._env_compiled` module is used instead of parsing `.env`.
+"""
+
+import functools
+import os
+
+# Every variable the app reads; `.env` is only skipped when all are set
+APP_ENV_VARS = (
+    "GOOGLE_API_KEY",
+    "GOOGLE_MODEL_NAME",
+    "SERPER_API_KEY",
+    "UNSPLASH_ACCESS_KEY",
+    "BLOG_LOG_FILE",
+)
+
+
+@functools.cache
+def load_env_once():
+    """Load variables from the `.env` file once per process"""
+    if os.getenv("BLOG_ENV_LOADED") or all(os.getenv(key) for key in APP_ENV_VARS):
+        return
+    try:
+        from blog_generator import _env_compiled
+    except ImportError:
+        from dotenv import load_dotenv
+        load_dotenv()
+    else:
+        # Match load_dotenv(): never override variables already set
+        for key, value in _env_compiled.ENV.items():
+            os.environ.setdefault(key, value)
+    os.environ["BLOG_ENV_LOADED"] = "1"
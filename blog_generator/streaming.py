@@ -0,0 +1,51 @@
+"""
+Helpers for streaming generation progress to the UI.
+
+Kept free of Gradio and CrewAI imports so `tools/check_streaming.py` can
+exercise them on their own.
+"""
+
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Minimum interval between streamed UI updates, in seconds
+UI_UPDATE_INTERVAL = 0.05
+
+
+def throttle(updates, interval: float = UI_UPDATE_INTERVAL):
+    """
+    Yield every update from updates, spaced at least interval apart.
+    
+    An update that arrives too soon is held back until the interval has
+    passed rather than dropped, so each one still reaches the UI.
+    """
+    last_yield = float('-inf')
+    for update in updates:
+        wait = last_yield + interval - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        last_yield = time.monotonic()
+        yield update
+
+
+def stream_task_outputs(generate, to_update, **params):
+    """
+    Run `generate(task_callback=..., **params)` in a worker thread.
+    
+    Yields `to_update(output)` for every output passed to the task callback,
+    in the order they arrive (callbacks may come from several threads), and
+    returns the result of `generate` once it finishes.
+    """
+    task_outputs = queue.Queue()
+    pool = ThreadPoolExecutor(max_workers=1)
+    try:
+        future = pool.submit(generate, task_callback=task_outputs.put, **params)
+        # Every callback has run by the time the future completes, so the
+        # sentinel is always queued after the last task output
+        future.add_done_callback(lambda _: task_outputs.put(None))
+        while (output := task_outputs.get()) is not None:
+            yield to_update(output)
+        return future.result()
+    finally:
+        pool.shutdown(wait=False)
@@ -1,107 +1,106 @@
 import os
 import json
-import requests
-from datetime import datetime, timedelta
-from dotenv import load_dotenv
-import markdown
-from crewai import Agent, Task, Crew, Process
-from crewai.tools import tool
-from functools import lru_cache
-from langchain_google_genai import ChatGoogleGenerativeAI
-from typing import Optional, Dict, Any
+import asyncio
+import threading
+from functools import cache
 import logging
-from tqdm import tqdm
-import nltk
-from nltk.sentiment import SentimentIntensityAnalyzer
-import re
-import random
-from crewai import LLM
-import time
 import hashlib
 import gradio as gr
-from gradio.components import Markdown, HTML
 import webbrowser
 from pathlib import Path
-from blog_generator.agents import BlogPostGenerator
+from types import MappingProxyType
+from typing import Optional
+from blog_generator.env import load_env_once
+from blog_generator.streaming import stream_task_outputs, throttle
 
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("blog_generator.log"),
-        logging.StreamHandler()
-    ]
-)
+# Logging is configured by the application entry point (app.py)
 logger = logging.getLogger("BlogPostGenerator")
 
 # Load environment variables
-load_dotenv()
+load_env_once()
+
+# Stylesheet for the UI; Gradio reads it once when the Blocks are built and
+# inlines it into the page config
+_CSS_PATH = Path(__file__).parent / "static" / "app.css"
+
+# Map date range choices to API values
+_DATE_RANGE_MAP = MappingProxyType({
+    "All time": None,
+    "Last week": "last_week",
+    "Last month": "last_month",
+    "Last year": "last_year",
+    "Last 1 month": "1m",
+    "Last 2 months": "2m",
+    "Last 3 months": "3m",
+    "Last 4 months": "4m",
+    "Last 5 months": "5m",
+    "Last 6 months": "6m"
+})
+
+# Map length choices to task description
+_LENGTH_MAP = MappingProxyType({
+    "Short (500-1000 words)": "short",
+    "Medium (1000-2000 words)": "medium",
+    "Long (2000+ words)": "long"
+})
+
+# Example parameter sets shown under the generate form
+_EXAMPLES = [
+    ["Generative AI in Healthcare", "diagnostic applications", "Last year", "Professional", "Medium (1000-2000 words)", 0.7, True, True],
+    ["Blockchain Technology", "recent advancements in scalability", "Last 3 months", "Technical", "Long (2000+ words)", 0.5, True, True],
+    ["Python Programming", "best practices for data science", "All time", "Conversational", "Short (500-1000 words)", 0.8, False, True]
+]
+
+# One JSON file per generation parameter set, pointing at the files it produced
+GENERATION_CACHE_DIR = ".generation_cache"
+
+
+def _generation_cache_key(*params) -> str:
+    """Hash the generation parameters into a cache key"""
+    payload = json.dumps(params, sort_keys=True).encode('utf-8')
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _load_cached_generation(key: str) -> Optional[dict]:
+    """Return a previous generation result, or None if it's missing or its files are gone"""
+    cache_path = os.path.join(GENERATION_CACHE_DIR, f"{key}.json")
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            result = json.load(f)
+        # Read the posts back from disk so edits made since generation show up
+        with open(result['filepath'], 'r', encoding='utf-8') as f:
+            result['content'] = f.read()
+        with open(result['html_path'], 'r', encoding='utf-8') as f:
+            result['html_content'] = f.read()
+    except (OSError, ValueError, KeyError):
+        return None
+    return result
+
+
+def _save_cached_generation(key: str, result: dict):
+    """Persist a successful generation result, minus the post bodies"""
+    os.makedirs(GENERATION_CACHE_DIR, exist_ok=True)
+    entry = {k: v for k, v in result.items() if k not in ('content', 'html_content')}
+    cache_path = os.path.join(GENERATION_CACHE_DIR, f"{key}.json")
+    tmp_path = f"{cache_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(entry, f)
+    os.replace(tmp_path, cache_path)
 
 
 def create_ui():
     """Create Gradio UI for the blog post generator"""
+    # Imported here so importing this module doesn't pull in CrewAI and the LLM stack
+    from blog_generator.agents import BlogPostGenerator, _post_paths, _render_md
+    
     generator = BlogPostGenerator()
     
     with gr.Blocks(
-    title="AI Blog Post Generator", 
-    theme="soft",
-
-     css="""
-        .gradio-container { 
-            background: #0d1017 !important;
-            max-width: 1400px !important;
-            margin: 0 auto !important;
-        }
-        body, .block, .tabs, .tabitem, .row, .column {
-            background: #0d1017 !important; 
-        }
-        .markdown, .html {
-            background: white !important;
-            padding: 20px !important;
-            border-radius: 8px !important;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1) !important;
-        }
-        .progress-bar {
-            height: 6px !important;
-            border-radius: 3px !important;
-        }
-        .status-message {
-            padding: 12px;
-            border-radius: 4px;
-            margin: 10px 0;
-        }
-        .success-message {
-            background-color: #e6f7ee;
-            color: #0d1017;
-            border-left: 4px solid #0d1017;
-        }
-        .error-message {
-            background-color: #fde8e8;
-            color: #c23030;
-            border-left: 4px solid #c23030;
-        }
-        .warning-message {
-            background-color: #fff8e6;
-            color: #8a6d3b;
-            border-left: 4px solid #8a6d3b;
-        }
-        .loading-message {
-            background-color: #e6f3ff;
-            color: #1a73e8;
-            border-left: 4px solid #1a73e8;
-        }
-        .generating {
-            animation: pulse 1.5s infinite;
-        }
-        @keyframes pulse {
-            0% { opacity: 1; }
-            50% { opacity: 0.6; }
-            100% { opacity: 1; }
-        }
-        """
-) as demo:
+        title="AI Blog Post Generator",
+        theme="soft",
+        css_paths=[_CSS_PATH]
+    ) as demo:
         gr.Markdown("# 📝 AI Blog Post Generator")
         gr.Markdown("Generate, edit, and manage high-quality technical blog posts using AI")
         
@@ -114,9 +113,7 @@ def create_ui():
                         focus = gr.Textbox(label="Specific Focus", placeholder="e.g., latest trends, applications in finance")
                         date_range = gr.Dropdown(
                             label="Date Range for Research",
-                            choices=["All time", "Last week", "Last month", "Last year", 
-                                    "Last 1 month", "Last 2 months", "Last 3 months", 
-                                    "Last 4 months", "Last 5 months", "Last 6 months"],
+                            choices=list(_DATE_RANGE_MAP),
                             value="All time"
                         )
                         tone = gr.Dropdown(
@@ -126,7 +123,7 @@ def create_ui():
                         )
                         length = gr.Dropdown(
                             label="Post Length",
-                            choices=["Short (500-1000 words)", "Medium (1000-2000 words)", "Long (2000+ words)"],
+                            choices=list(_LENGTH_MAP),
                             value="Medium (1000-2000 words)"
                         )
                         temperature = gr.Slider(
@@ -139,6 +136,8 @@ def create_ui():
                         )
                         add_toc = gr.Checkbox(label="Add Table of Contents", value=True)
                         seo_optimized = gr.Checkbox(label="SEO Optimized", value=True)
+                        analyze_sentiment = gr.Checkbox(label="Analyze Sentiment", value=False,
+                                                        info="Score the post's tone with NLTK VADER")
                         
                         generate_btn = gr.Button("Generate Blog Post", variant="primary")
                         
@@ -160,11 +159,7 @@ def create_ui():
                 
                 # Examples
                 examples = gr.Examples(
-                    examples=[
-                        ["Generative AI in Healthcare", "diagnostic applications", "Last year", "Professional", "Medium (1000-2000 words)", 0.7, True, True],
-                        ["Blockchain Technology", "recent advancements in scalability", "Last 3 months", "Technical", "Long (2000+ words)", 0.5, True, True],
-                        ["Python Programming", "best practices for data science", "All time", "Conversational", "Short (500-1000 words)", 0.8, False, True]
-                    ],
+                    examples=_EXAMPLES,
                     inputs=[topic, focus, date_range, tone, length, temperature, add_toc, seo_optimized],
                     outputs=[md_output, html_output, file_output, info_output],
                     fn=generator.generate_blog_post,
@@ -207,43 +202,58 @@ def create_ui():
                 edit_file_output = gr.Files(label="Download Files", visible=False)
         
         # Generation function
-        def generate_blog_post_wrapper(topic, focus, date_range, tone, length, temperature, add_toc, seo_optimized):
+        def generate_blog_post_wrapper(topic, focus, date_range, tone, length, temperature, add_toc, seo_optimized,
+                                       analyze_sentiment):
             if not topic:
                 raise gr.Error("Please enter a blog topic")
             
-            # Map date range to API values
-            date_range_map = {
-                "All time": None,
-                "Last week": "last_week",
-                "Last month": "last_month",
-                "Last year": "last_year",
-                "Last 1 month": "1m",
-                "Last 2 months": "2m",
-                "Last 3 months": "3m",
-                "Last 4 months": "4m",
-                "Last 5 months": "5m",
-                "Last 6 months": "6m"
-            }
-            date_range_val = date_range_map.get(date_range, None)
+            yield from throttle(_generate_updates(
+                topic, focus, date_range, tone, length, temperature, add_toc, seo_optimized,
+                analyze_sentiment
+            ))
+        
+        def _stream_generation(_gen=generator, _render=_render_md, **params):
+            # Run the crew in a worker thread and show each task's output as it
+            # finishes; returns the final result once the crew is done
+            def to_update(output):
+                partial = f"*{output.agent} finished...*\n\n{output.raw}"
+                return partial, _render(partial), gr.update(), gr.update()
+            
+            return (yield from stream_task_outputs(_gen.generate_blog_post, to_update, **params))
+        
+        def _generate_updates(topic, focus, date_range, tone, length, temperature, add_toc, seo_optimized,
+                              analyze_sentiment,
+                              _date_ranges=_DATE_RANGE_MAP, _lengths=_LENGTH_MAP):
+            yield f"*Generating blog post on {topic}...*", gr.update(), gr.update(), gr.update()
             
-            # Map length to task description
-            length_map = {
-                "Short (500-1000 words)": "short",
-                "Medium (1000-2000 words)": "medium",
-                "Long (2000+ words)": "long"
-            }
-            length_val = length_map.get(length, "medium")
+            date_range_val = _date_ranges.get(date_range)
+            length_val = _lengths.get(length, "medium")
             
-            result = generator.generate_blog_post(
-                topic=topic,
-                focus=focus if focus else "latest trends and developments",
-                date_range=date_range_val,
-                add_toc=add_toc,
-                seo_optimized=seo_optimized,
-                tone=tone.lower(),
-                length=length_val,
-                temperature=temperature
+            # Identical parameters reuse the earlier post instead of rerunning the crew
+            cache_key = _generation_cache_key(
+                topic, focus, date_range, tone, length, temperature, add_toc, seo_optimized,
+                analyze_sentiment
             )
+            result = _load_cached_generation(cache_key)
+            if result is None:
+                result = yield from _stream_generation(
+                    topic=topic,
+                    focus=focus if focus else "latest trends and developments",
+                    date_range=date_range_val,
+                    add_toc=add_toc,
+                    seo_optimized=seo_optimized,
+                    tone=tone.lower(),
+                    length=length_val,
+                    temperature=temperature,
+                    analyze_sentiment=analyze_sentiment
+                )
+                if 'error' not in result:
+                    try:
+                        _save_cached_generation(cache_key, result)
+                    except OSError as e:
+                        logger.warning("Could not cache generation for '%s': %s", topic, e)
+            else:
+                logger.info("Reusing cached generation for '%s'", topic)
             
             # Prepare files for download
             files = []
@@ -252,12 +262,13 @@ def create_ui():
             if 'html_path' in result and os.path.exists(result['html_path']):
                 files.append(result['html_path'])
             
-            # Change the return statement to ensure all outputs are connected:
-            return {
-                md_output: result.get('content', ''),
-                html_output: result.get('html_content', ''),
-                file_output: files,
-                info_output: {
+            # Values in the order of the event's outputs:
+            # md_output, html_output, file_output, info_output
+            yield (
+                result.get('content', ''),
+                result.get('html_content', ''),
+                files,
+                {
                     'topic': result.get('topic'),
                     'focus': result.get('focus'),
                     'image_url': result.get('image_url'),
@@ -266,56 +277,46 @@ def create_ui():
                     'file_path': result.get('filepath'),
                     'html_path': result.get('html_path')
                 }
-            }
+            )
         
         # Edit tab functions
-        def refresh_post_list():
-            return gr.update(choices=generator.list_generated_posts())
+        def refresh_post_list(_gen=generator):
+            return gr.update(choices=_gen.list_generated_posts())
         
-        def load_post(filepath):
+        async def load_post(filepath, _gen=generator):
             if not filepath:
                 raise gr.Error("Please select a post to load")
-            content = generator.load_post_for_editing(filepath)
-            html_path = filepath.replace('.md', '.html')
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-            return {
-                edit_md: content,
-                edit_html_preview: html_content,
-                edit_status: f"Loaded: {os.path.basename(filepath)}"
-            }
+            paths = _post_paths(filepath)
+            # Read off the event loop so streaming generation updates keep flowing
+            content, html_content = await asyncio.gather(
+                asyncio.to_thread(_gen.load_post_for_editing, filepath),
+                asyncio.to_thread(_gen.load_post_html, filepath)
+            )
+            return content, html_content, f"Loaded: {paths.name}"
         
-        def save_post(filepath, content):
+        def save_post(filepath, content, _gen=generator):
             if not filepath:
                 raise gr.Error("No post selected for saving")
-            result = generator.save_edited_post(filepath, content)
+            result = _gen.save_edited_post(filepath, content)
             if result['status'] == 'success':
                 files = [filepath, result['html_path']]
-                return {
-                    edit_html_preview: result['html_content'],
-                    edit_status: f"Saved: {os.path.basename(filepath)}",
-                    edit_file_output: files
-                }
+                return result['html_content'], f"Saved: {_post_paths(filepath).name}", files
             else:
-                return {
-                    edit_status: f"Error saving: {result['error']}"
-                }
+                return gr.update(), f"Error saving: {result['error']}", gr.update()
         
-        def delete_post(filepath):
+        def delete_post(filepath, _gen=generator):
             if not filepath:
                 raise gr.Error("No post selected for deletion")
-            result = generator.delete_post(filepath)
+            result = _gen.delete_post(filepath)
             if result['status'] == 'success':
-                return {
-                    post_selector: gr.update(choices=generator.list_generated_posts()),
-                    edit_md: "",
-                    edit_html_preview: "",
-                    edit_status: f"Deleted: {os.path.basename(filepath)}"
-                }
+                return (
+                    gr.update(choices=_gen.list_generated_posts()),
+                    "",
+                    "",
+                    f"Deleted: {_post_paths(filepath).name}"
+                )
             else:
-                return {
-                    edit_status: f"Error deleting: {result['error']}"
-                }
+                return gr.update(), gr.update(), gr.update(), f"Error deleting: {result['error']}"
         
         def download_markdown(filepath):
             if not filepath:
@@ -325,20 +326,24 @@ def create_ui():
         def download_html_fn(filepath):
             if not filepath:
                 raise gr.Error("No post selected")
-            return filepath.replace('.md', '.html')
+            return str(_post_paths(filepath).html)
         
         def view_post_in_browser(filepath):
             if not filepath:
                 raise gr.Error("No post selected")
-            html_path = filepath.replace('.md', '.html')
-            webbrowser.open(f"file://{os.path.abspath(html_path)}")
-            return {"edit_status": f"Opened in browser: {os.path.basename(html_path)}"}
+            html_path = _post_paths(filepath).html
+            # webbrowser.open can block while the desktop hands the URL off
+            threading.Thread(target=webbrowser.open, args=(html_path.resolve().as_uri(),), daemon=True).start()
+            return f"Opened in browser: {html_path.name}"
         
         # Generate tab events
         generate_btn.click(
             fn=generate_blog_post_wrapper,
-            inputs=[topic, focus, date_range, tone, length, temperature, add_toc, seo_optimized],
-            outputs=[md_output, html_output, file_output, info_output]
+            inputs=[topic, focus, date_range, tone, length, temperature, add_toc, seo_optimized,
+                    analyze_sentiment],
+            outputs=[md_output, html_output, file_output, info_output],
+            show_progress="minimal",
+            concurrency_limit=1
         )
         
         # Edit tab events
@@ -383,4 +388,10 @@ def create_ui():
             outputs=[edit_status]
         )
     
+    # The layout is fixed once the Blocks context closes, so each component's
+    # API schema can be computed once instead of on every API info request
+    for block in demo.blocks.values():
+        if hasattr(block, 'api_info'):
+            block.api_info = cache(block.api_info)
+    
     return demo
@@ -0,0 +1,54 @@
+"""
+Check that every crew task output reaches the UI when streaming.
+
+Drives the generate tab's streaming path (`stream_task_outputs` behind
+`throttle`) with a fake generator whose task callbacks fire close together
+and then after a long gap, like the parallel fact-check/illustration tasks
+followed by the editor.
+
+Usage:
+    python tools/check_streaming.py
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from blog_generator.streaming import stream_task_outputs, throttle
+
+# Seconds after start at which each fake task finishes
+TASK_FINISH_TIMES = (0.10, 0.11, 0.115, 0.60)
+
+
+def fake_generate_blog_post(task_callback, **params):
+    start = time.monotonic()
+    for i, finish in enumerate(TASK_FINISH_TIMES):
+        time.sleep(max(0.0, start + finish - time.monotonic()))
+        output = SimpleNamespace(agent=f"Agent {i}", raw=f"output {i}")
+        # Report from another thread, as CrewAI does for async tasks
+        reporter = threading.Thread(target=task_callback, args=(output,))
+        reporter.start()
+        reporter.join()
+    return {'topic': params['topic']}
+
+
+def main():
+    def updates():
+        result = yield from stream_task_outputs(
+            fake_generate_blog_post, lambda output: output.raw, topic="Streaming"
+        )
+        yield result
+
+    received = list(throttle(updates()))
+    expected = [f"output {i}" for i in range(len(TASK_FINISH_TIMES))] + [{'topic': "Streaming"}]
+    if received != expected:
+        sys.exit(f"FAIL: expected {expected!r}, got {received!r}")
+    print(f"OK: all {len(TASK_FINISH_TIMES)} task outputs and the final result were yielded")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Compile the `.env` file into an importable Python module.
+
+Writes `blog_generator/_env_compiled.py` containing a single `ENV` dict.
+At startup `load_env_once()` imports that module (served from cached
+bytecode) instead of parsing `.env`. Re-run this script whenever `.env`
+changes; delete the generated module to go back to parsing `.env`.
+
+Usage:
+    python tools/compile_env.py [path/to/.env]
+"""
+
+import sys
+from pathlib import Path
+
+from dotenv import dotenv_values
+
+ROOT = Path(__file__).resolve().parent.parent
+TARGET = ROOT / "blog_generator" / "_env_compiled.py"
+
+
+def main():
+    env_path = Path(sys.argv[1]) if len(sys.argv) > 1 else ROOT / ".env"
+    if not env_path.exists():
+        sys.exit(f"No .env file found at {env_path}")
+
+    env = {key: value for key, value in dotenv_values(env_path).items() if value is not None}
+    TARGET.write_text(
+        "# Generated by tools/compile_env.py - do not edit or commit.\n"
+        f"ENV = {env!r}\n",
+        encoding="utf-8"
+    )
+    print(f"Wrote {len(env)} variables to {TARGET}")
+
+
+if __name__ == "__main__":
+    main()
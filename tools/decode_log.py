@@ -0,0 +1,29 @@
+"""
+Render a binary log written by `BinaryLogHandler` back to text.
+
+Usage:
+    python tools/decode_log.py blog_generator.log.bin
+"""
+
+import logging
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from blog_generator.binlog import decode_frames
+
+
+def main():
+    if len(sys.argv) != 2:
+        sys.exit("Usage: python tools/decode_log.py <logfile>")
+
+    data = Path(sys.argv[1]).read_bytes()
+    for created, levelno, message in decode_frames(data):
+        timestamp = datetime.fromtimestamp(created).strftime('%Y-%m-%d %H:%M:%S,%f')[:-3]
+        print(f"{timestamp} - {logging.getLevelName(levelno)} - {message}")
+
+
+if __name__ == "__main__":
+    main()